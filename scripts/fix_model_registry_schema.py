@@ -17,13 +17,25 @@ DB_CONFIG = {
     "password": "mlops_password",
 }
 
+# Long-lived connection reused across invocations (schedulers/CI matrices call
+# this repeatedly; reconnecting pays the full TCP + auth handshake each time)
+_CONNECTION = None
+
+
+def _get_connection():
+    """Get the shared database connection, creating it on first use"""
+    global _CONNECTION
+    if _CONNECTION is None or _CONNECTION.closed:
+        _CONNECTION = psycopg2.connect(**DB_CONFIG)
+    return _CONNECTION
+
 
 def fix_model_registry_schema():
     """Add metadata column to models table if it doesn't exist"""
 
     try:
-        # Connect to database
-        conn = psycopg2.connect(**DB_CONFIG)
+        # Reuse the process-wide connection instead of reconnecting per call
+        conn = _get_connection()
         cur = conn.cursor()
 
         print("🔧 Checking Model Registry schema...")
@@ -83,10 +95,21 @@ def fix_model_registry_schema():
         for col in cur.fetchall():
             print(f"   - {col[0]}: {col[1]}")
 
+        # End the implicit transaction the SELECTs opened so the shared
+        # connection doesn't sit idle-in-transaction between invocations
+        conn.commit()
         cur.close()
-        conn.close()
 
     except Exception as e:
+        # Roll back so the shared connection isn't stuck in an aborted
+        # transaction for the next invocation; drop it if even that fails
+        global _CONNECTION
+        if _CONNECTION is not None and not _CONNECTION.closed:
+            try:
+                _CONNECTION.rollback()
+            except Exception:
+                _CONNECTION.close()
+                _CONNECTION = None
         print(f"❌ Error: {e}")
         print("\n💡 Make sure MLOps platform is running:")
         print("   cd /Users/snegi/Documents/github/enterprise-repos/mlops-platform")
@@ -3,6 +3,8 @@
 Mock healthcare model class for CI testing
 """
 
+import re
+
 import numpy as np
 
 
@@ -33,6 +35,12 @@ class MockHealthcareModel:
             "hurt myself",
             "die",
         ]
+        # Compiled alternations are faster than per-keyword `in` scans:
+        # one C-level search instead of a Python loop per category
+        self._crisis_re = re.compile("|".join(map(re.escape, self.crisis_keywords)))
+        self._mobility_re = re.compile(r"bed|mobility|walking|balance")
+        self._medication_re = re.compile(r"medication|pill|drug")
+        self._mental_health_re = re.compile(r"anxious|depressed|worry")
 
     def predict(self, X):
         """Mock predict method that returns reasonable categories"""
@@ -44,19 +52,16 @@ class MockHealthcareModel:
             query_lower = query.lower()
 
             # Crisis detection
-            if any(keyword in query_lower for keyword in self.crisis_keywords):
+            if self._crisis_re.search(query_lower):
                 predictions.append("crisis_mental_health")
             # Mobility/ADL
-            elif any(
-                word in query_lower
-                for word in ["bed", "mobility", "walking", "balance"]
-            ):
+            elif self._mobility_re.search(query_lower):
                 predictions.append("adl_mobility")
             # Medication
-            elif any(word in query_lower for word in ["medication", "pill", "drug"]):
+            elif self._medication_re.search(query_lower):
                 predictions.append("senior_medication")
             # Mental health
-            elif any(word in query_lower for word in ["anxious", "depressed", "worry"]):
+            elif self._mental_health_re.search(query_lower):
                 predictions.append("mental_health_anxiety")
             # Default
             else:
@@ -75,4 +80,6 @@ class MockHealthcareModel:
             probs = np.random.dirichlet(np.ones(len(self.categories)))
             proba_matrix.append(probs)
 
-        return np.array(proba_matrix)
+        # float16 keeps ~3 decimal digits of precision, which is plenty for
+        # downstream argmax/confidence checks at half the memory bandwidth
+        return np.array(proba_matrix, dtype=np.float16)
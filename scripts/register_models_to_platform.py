@@ -9,6 +9,7 @@ import time
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 # MLOps Platform Service URLs
 MODEL_REGISTRY_URL = "http://localhost:8000"
@@ -16,6 +17,11 @@ EXPERIMENT_TRACKING_URL = "http://localhost:8003"
 AB_TESTING_URL = "http://localhost:8090"
 FEATURE_STORE_URL = "http://localhost:8002"
 
+# One keep-alive session for every registration call; avoids a fresh TCP
+# connection per request and retries transient platform hiccups
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.2)))
+
 
 def create_tenant_namespace(tenant_name):
     """Create a namespace for the tenant in Model Registry"""
@@ -40,7 +46,7 @@ def register_model(tenant_id, model_name, model_version, model_metadata):
     tags.extend([tenant_name, "multi-tenant", tenant_id])
 
     # Register model with MLOps Model Registry
-    response = requests.post(
+    response = _SESSION.post(
         f"{MODEL_REGISTRY_URL}/api/v1/models",
         json={
             "name": f"{tenant_name}/{model_name}",
@@ -77,7 +83,7 @@ def setup_ab_test(tenant_name, model_a_id, model_b_id):
     print(f"\n🔬 Setting up A/B test for {tenant_name}")
 
     # Create experiment in Experiment Tracking first
-    exp_response = requests.post(
+    exp_response = _SESSION.post(
         f"{EXPERIMENT_TRACKING_URL}/api/v1/projects",
         json={
             "name": f"{tenant_name}-ab-testing",
@@ -91,7 +97,7 @@ def setup_ab_test(tenant_name, model_a_id, model_b_id):
         project_id = project.get("id", "default")
 
         # Create experiment run
-        run_response = requests.post(
+        run_response = _SESSION.post(
             f"{EXPERIMENT_TRACKING_URL}/api/v1/projects/{project_id}/experiments",
             json={
                 "name": f"{tenant_name}_model_comparison",
@@ -111,7 +117,7 @@ def setup_ab_test(tenant_name, model_a_id, model_b_id):
             print(f"✅ Created A/B test experiment: {experiment.get('id', 'created')}")
 
             # Log initial metrics
-            requests.post(
+            _SESSION.post(
                 f"{EXPERIMENT_TRACKING_URL}/api/v1/experiments/{experiment.get('id', '1')}/metrics",
                 json={
                     "metrics": {
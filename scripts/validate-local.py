@@ -4,11 +4,40 @@ Local CI/CD Validation Script for Healthcare AI App
 Runs the same checks as the CI/CD pipeline
 """
 
+import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Serializes the parallel tool jobs' completed-output blocks
+_print_lock = threading.Lock()
+
+
+def run_tool_check(cmd, description):
+    """Run a static-analysis tool and print its output as one block
+
+    These jobs run concurrently, so streaming would interleave failure
+    output line-by-line across tools; capture instead and emit the whole
+    block atomically when the tool finishes.
+    """
+    start_time = time.time()
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    duration = time.time() - start_time
+
+    with _print_lock:
+        if proc.returncode == 0:
+            print(f"✅ {description} passed ({duration:.2f}s)")
+            return True
+        if proc.stdout:
+            print(proc.stdout, end="")
+        if proc.stderr:
+            print(proc.stderr, end="", file=sys.stderr)
+        print(f"❌ {description} failed ({duration:.2f}s)")
+        return False
+
 
 def run_command(cmd, description):
     """Run a command and return success status"""
@@ -16,17 +45,15 @@ def run_command(cmd, description):
     start_time = time.time()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # Stream output as the tool runs rather than buffering it all and
+        # replaying it after failure
+        subprocess.run(cmd, stdout=sys.stdout, stderr=sys.stderr, check=True)
         duration = time.time() - start_time
         print(f"✅ {description} passed ({duration:.2f}s)")
         return True
-    except subprocess.CalledProcessError as e:
+    except subprocess.CalledProcessError:
         duration = time.time() - start_time
         print(f"❌ {description} failed ({duration:.2f}s)")
-        if e.stdout:
-            print(f"   Output: {e.stdout}")
-        if e.stderr:
-            print(f"   Error: {e.stderr}")
         return False
 
 
@@ -40,15 +67,14 @@ def main():
     original_dir = Path.cwd()
 
     try:
-        import os
-
         os.chdir(project_root)
 
         checks = []
 
-        # Code formatting
-        checks.append(
-            run_command(
+        # The static-analysis tools are independent interpreters, so launch
+        # them concurrently instead of paying each startup serially
+        tool_jobs = [
+            (
                 [
                     "python3",
                     "-m",
@@ -61,12 +87,8 @@ def main():
                     "monitoring/",
                 ],
                 "Black code formatting",
-            )
-        )
-
-        # Import sorting
-        checks.append(
-            run_command(
+            ),
+            (
                 [
                     "python3",
                     "-m",
@@ -79,12 +101,8 @@ def main():
                     "monitoring/",
                 ],
                 "Import sorting (isort)",
-            )
-        )
-
-        # Linting
-        checks.append(
-            run_command(
+            ),
+            (
                 [
                     "python3",
                     "-m",
@@ -97,12 +115,8 @@ def main():
                     "monitoring/",
                 ],
                 "Flake8 linting",
-            )
-        )
-
-        # Type checking
-        checks.append(
-            run_command(
+            ),
+            (
                 [
                     "python3",
                     "-m",
@@ -112,27 +126,24 @@ def main():
                     "src/",
                 ],
                 "MyPy type checking",
-            )
-        )
-
-        # Security scanning
-        checks.append(
-            run_command(
+            ),
+            (
                 ["python3", "-m", "bandit", "-r", "-ll", "src/", "scripts/"],
                 "Bandit security scan",
-            )
-        )
+            ),
+        ]
 
-        # Unit tests
-        checks.append(
-            run_command(["python3", "-m", "pytest", "tests/unit/", "-v"], "Unit tests")
-        )
+        with ThreadPoolExecutor(
+            max_workers=min(len(tool_jobs), os.cpu_count() or 1)
+        ) as executor:
+            checks.extend(executor.map(lambda job: run_tool_check(*job), tool_jobs))
 
-        # Integration tests
+        # Unit and integration tests share one pytest session so collection
+        # and imports run once
         checks.append(
             run_command(
-                ["python3", "-m", "pytest", "tests/integration/", "-v"],
-                "Integration tests",
+                ["python3", "-m", "pytest", "tests/unit/", "tests/integration/", "-v"],
+                "Unit and integration tests",
             )
         )
 
@@ -7,22 +7,194 @@ import hashlib
 import json
 import logging
 import random
+import re
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 # For proper LLM integration (optional)
 try:
-    from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
+    import torch
+    from transformers import AutoModelForCausalLM, AutoTokenizer
 
     LLM_AVAILABLE = True
 except ImportError:
     LLM_AVAILABLE = False
     logger.warning("LLM libraries not available. Running in knowledge-base only mode.")
 
+# orjson parses the training JSONL several times faster than stdlib json;
+# both accept raw bytes lines, so no per-line strip/decode is needed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Fast non-cryptographic hashing for the process-local response cache; the
+# cache key never leaves the process, so SHA-256 was pure overhead
+try:
+    import xxhash
+
+    def _hash_query(text: str) -> int:
+        return xxhash.xxh3_64_intdigest(text.encode())
+
+except ImportError:
+
+    def _hash_query(text: str) -> int:
+        return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+
+
+# Bounded response cache: oldest entries are evicted past this size
+RESPONSE_CACHE_MAX = 4096
+
+# Bound for the per-helper memo caches on the classification path
+DETECT_CACHE_MAX = 8192
+
+# Ring-buffer bound for conversation history; oldest entries roll off
+HISTORY_MAX = 2048
+
+# Constant LLM prompt pieces; the prefix is prefilled once so generation
+# only pays attention over the user's tokens
+_PROMPT_PREFIX = (
+    "Healthcare Assistant: I am a healthcare support assistant trained on "
+    "comprehensive healthcare data.\n\nUser: "
+)
+_PROMPT_SUFFIX = "\n\nHealthcare Assistant: "
+
+
+@dataclass(slots=True)
+class HistoryEntry:
+    """Compact per-request history record; slots drop the per-entry dict"""
+
+    user: str
+    assistant: str
+    category: str
+    timestamp: int  # time.time_ns(); formatted to ISO only on read
+
+
+# Personal-context triggers fused into one pattern; the priority tuple keeps
+# the original if/elif precedence when several triggers appear
+_PERSONAL_CTX_RE = re.compile(
+    r"(?P<mother>my mother|my mom)"
+    r"|(?P<father>my father|my dad)"
+    r"|(?P<parent>my parent)"
+    r"|(?P<spouse>my spouse|my husband|my wife)"
+    r"|(?P<self>myself|i feel|i am)"
+)
+_CTX_PRIORITY = ("mother", "father", "parent", "spouse", "self")
+_CTX_MAP = {
+    "mother": "your mother",
+    "father": "your father",
+    "parent": "your parent",
+    "spouse": "your spouse",
+    "self": "your personal situation",
+}
+
+# TF-IDF retrieval (optional): scores every loaded conversation with one
+# sparse matrix product instead of a Python loop over the first 500
+try:
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Multi-pattern keyword matching (optional): pyahocorasick finds every
+# category keyword in one C-level pass instead of ~70 substring scans
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Crisis phrases always checked before category scoring
+CRISIS_KEYWORDS = [
+    "suicide",
+    "kill myself",
+    "hurt myself",
+    "want to die",
+    "end it all",
+    "end my life",
+    "thinking about suicide",
+    "suicidal",
+]
+
+
+# E2E contextual overrides as data: each rule is (required terms, optional
+# terms, response) and matches when every required term appears and, if any
+# optional terms are listed, at least one of them does. Rule order preserves
+# the precedence of the old if/elif chain.
+_CONTEXTUAL_RULES = (
+    (
+        ("bed",),
+        ("getting out", "trouble", "father"),
+        "For assistance getting out of bed, consider: bed rails for support, adjusting bed height, and Physical therapy to improve strength. \u26a0\ufe0f Consult healthcare professionals for personalized mobility assessments.",
+    ),
+    (
+        ("medication reminder", "memory"),
+        (),
+        "For medication reminders with memory issues, consider: automated pill dispensers with alarms, blister packaging for daily doses, and medication management apps. \u26a0\ufe0f Work with healthcare providers for proper medication management.",
+    ),
+    (
+        ("overwhelmed", "dementia"),
+        (),
+        "Caring for someone with dementia is challenging. Contact your local Area Agency on Aging for resources and respite services to give you breaks. \u26a0\ufe0f Caregiver support is essential for your wellbeing.",
+    ),
+    (
+        ("exercises for seniors",),
+        (),
+        "Safe exercises for seniors include: Chair exercises for strength, Water aerobics for low-impact cardio, and Tai chi for balance. \u26a0\ufe0f Always consult healthcare providers before starting new exercise programs.",
+    ),
+    (
+        ("adaptive equipment", "eating"),
+        (),
+        "Adaptive eating equipment includes: Weighted utensils for tremors, Built-up handles for grip issues, and Plate guards to prevent spills. \u26a0\ufe0f Occupational therapists can recommend specific equipment for your needs.",
+    ),
+    (
+        ("bathing",),
+        ("help", "daily"),
+        "For daily bathing assistance, consider:\\n1) Shower chairs for safety\\n2) Grab bars for support\\n3) Bath mats for slip prevention\\n4) Adaptive bathing aids\\n\u26a0\ufe0f Occupational therapists can assess specific bathing safety needs.",
+    ),
+    (
+        ("medication",),
+        ("forgets", "memory"),
+        "For medication management with memory issues:\\n1) Pill organizers with alarms\\n2) Pharmacy blister packaging\\n3) Medication reminder apps\\n4) Family member assistance\\n\u26a0\ufe0f Work with healthcare providers for proper medication management.",
+    ),
+    (
+        ("isolated", "senior"),
+        (),
+        "For senior isolation concerns:\\n1) Community center activities\\n2) Senior support groups\\n3) Volunteer opportunities\\n4) Social technology programs\\n\u26a0\ufe0f Persistent isolation may indicate depression - consider professional support.",
+    ),
+    (
+        ("equipment", "mobility"),
+        (),
+        "For mobility equipment needs:\\n1) Walking aids (canes, walkers)\\n2) Grab bars and safety rails\\n3) Mobility chairs and scooters\\n4) Home modifications\\n\u26a0\ufe0f Physical therapists can assess specific mobility equipment needs.",
+    ),
+    (
+        ("anxious", "health"),
+        (),
+        "For health-related anxiety:\\n1) Deep breathing exercises\\n2) Professional counseling support\\n3) Health education resources\\n4) Stress management techniques\\n\u26a0\ufe0f Persistent anxiety warrants professional mental health evaluation.",
+    ),
+)
+
+# Automaton over every trigger term so one pass over the input yields the
+# matched-term set the rule scan consumes
+if AHOCORASICK_AVAILABLE:
+    _CTX_TRIGGER_AUTOMATON = ahocorasick.Automaton()
+    for _required, _optional, _response in _CONTEXTUAL_RULES:
+        for _term in _required + _optional:
+            _CTX_TRIGGER_AUTOMATON.add_word(_term, _term)
+    _CTX_TRIGGER_AUTOMATON.make_automaton()
+else:
+    _CTX_TRIGGER_AUTOMATON = None
+
 
 class HealthcareAIEngine:
     """Advanced Healthcare AI with both LLM and knowledge-based responses"""
@@ -31,34 +203,70 @@ class HealthcareAIEngine:
         if not LLM_AVAILABLE:
             use_llm = False
         self.use_llm = use_llm
-        self.conversation_history = []
-        self.knowledge_base = self._load_knowledge_base()
-        self.response_cache = {}
-        self.llm_pipeline = None
+        self.conversation_history = deque(maxlen=HISTORY_MAX)
+        # The knowledge base and its derived indexes are built lazily on the
+        # first request, so processes that never serve traffic (health-check
+        # workers, import-only tooling) skip the whole parse
+        self._knowledge_base: Optional[Dict[str, Any]] = None
+        self.response_cache = OrderedDict()
+        # Memo caches for the pure classification helpers, keyed on the
+        # lowered input; repeat queries skip the keyword scans entirely
+        self._category_cache = OrderedDict()
+        self._personal_ctx_cache = OrderedDict()
+        self.model = None
         self.response_templates = self._load_response_templates()
+        # All starter/response/ending combinations rendered once per
+        # category; picking one is then a single randrange instead of three
+        # random.choice calls plus string assembly per request
+        self._rendered_templates = {
+            category: tuple(
+                f"{starter}{body}{ending}"
+                for starter in parts.get("starters", [""])
+                for body in parts.get("responses", [""])
+                for ending in parts.get("endings", [""])
+            )
+            for category, parts in self.response_templates.items()
+        }
         self.personalization_context = {}
 
         if use_llm:
             try:
                 # Initialize language model for unique response generation
                 logger.info(f"Loading LLM: {model_name}")
-                self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-                self.model = AutoModelForCausalLM.from_pretrained(model_name)
+                # use_fast selects the Rust tokenizer backend
+                self.tokenizer = AutoTokenizer.from_pretrained(
+                    model_name, use_fast=True
+                )
+                # FP16 on GPU halves the weight/activation bytes generation
+                # has to move; CPU stays FP32 for compatibility
+                self._device = "cuda" if torch.cuda.is_available() else "cpu"
+                dtype = torch.float16 if self._device == "cuda" else torch.float32
+                self.model = AutoModelForCausalLM.from_pretrained(
+                    model_name, torch_dtype=dtype, low_cpu_mem_usage=True
+                ).to(self._device)
+                self.model.eval()
 
                 # Add padding token if not present
                 if self.tokenizer.pad_token is None:
                     self.tokenizer.pad_token = self.tokenizer.eos_token
 
-                # Create pipeline for text generation
-                self.llm_pipeline = pipeline(
-                    "text-generation",
-                    model=self.model,
-                    tokenizer=self.tokenizer,
-                    max_length=150,
-                    temperature=0.8,
-                    top_p=0.9,
-                    do_sample=True,
-                )
+                # Prefill the constant prompt prefix once; every request
+                # reuses these key/value states instead of re-running
+                # attention over the same ~20 tokens
+                self._prefix_ids = None
+                self._prefix_kv = None
+                try:
+                    self._prefix_ids = self.tokenizer(
+                        _PROMPT_PREFIX, return_tensors="pt"
+                    ).input_ids.to(self._device)
+                    with torch.inference_mode():
+                        self._prefix_kv = self.model(
+                            self._prefix_ids, use_cache=True
+                        ).past_key_values
+                except Exception as e:
+                    logger.warning(f"Prompt prefix prefill failed: {e}")
+                    self._prefix_kv = None
+
                 logger.info("LLM loaded successfully")
             except Exception as e:
                 logger.warning(
@@ -66,6 +274,121 @@ class HealthcareAIEngine:
                 )
                 self.use_llm = False
 
+    def _ensure_loaded(self):
+        """Build the knowledge base and derived indexes on first use"""
+        if self._knowledge_base is None:
+            self._knowledge_base = self._load_knowledge_base()
+            self._build_keyword_matcher()
+            self._build_similarity_index()
+
+    @property
+    def knowledge_base(self) -> Dict[str, Any]:
+        self._ensure_loaded()
+        return self._knowledge_base
+
+    def _build_keyword_matcher(self):
+        """Compile category/crisis keywords into a single Aho-Corasick automaton
+
+        One automaton walk over the input replaces a Python-level substring
+        scan per keyword; falls back to the plain loop when pyahocorasick is
+        not installed.
+        """
+        self._category_kw_sets = {
+            cat: frozenset(kws)
+            for cat, kws in self.knowledge_base.get("category_keywords", {}).items()
+        }
+        self._crisis_kw_set = frozenset(CRISIS_KEYWORDS)
+
+        # Split keyword tables for the fallback scorer: single words resolve
+        # with one hash-set intersection over the tokenized input, only
+        # multi-word phrases still need a substring check
+        self._single_kw_sets = {
+            cat: frozenset(kw for kw in kws if " " not in kw)
+            for cat, kws in self._category_kw_sets.items()
+        }
+        self._phrase_kws = {
+            cat: tuple(kw for kw in kws if " " in kw)
+            for cat, kws in self._category_kw_sets.items()
+        }
+        # Integer-ID bitmaps for the fallback scorer: each single-word
+        # keyword gets a bit, so per-category scores collapse to one AND
+        # plus a popcount (int.bit_count) instead of building frozenset
+        # intersections per category. Crisis keywords stay out of the
+        # bitmaps: they keep substring semantics below so e.g. "suicides"
+        # still matches "suicide"
+        self._kw_bits: Dict[str, int] = {}
+        for keyword in sorted(frozenset().union(*self._single_kw_sets.values())):
+            self._kw_bits[keyword] = 1 << len(self._kw_bits)
+        self._cat_bitmaps = {
+            cat: sum(self._kw_bits[kw] for kw in kws)
+            for cat, kws in self._single_kw_sets.items()
+        }
+
+        self._kw_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for keyword in self._crisis_kw_set.union(*self._category_kw_sets.values()):
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._kw_automaton = automaton
+
+    def _build_similarity_index(self):
+        """Build the retrieval structures over the loaded conversations
+
+        Always builds the flat structure-of-arrays corpus plus an inverted
+        word index; when scikit-learn is present a TF-IDF matrix is fitted on
+        top so retrieval becomes one sparse matrix product.
+        """
+        self._vectorizer = None
+
+        # Structure-of-arrays layout: parallel flat lists plus per-category
+        # row indices keep the scan data contiguous instead of chasing one
+        # dict per conversation
+        user_msgs: List[str] = []
+        asst_msgs: List[str] = []
+        token_sets: List[frozenset] = []
+        row_cats: List[str] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+        cat_spans = {}
+        for category, cat_convs in self.knowledge_base["conversations"].items():
+            start = len(user_msgs)
+            for conv in cat_convs:
+                cid = len(user_msgs)
+                user_msgs.append(conv["user"])
+                asst_msgs.append(conv["assistant"])
+                token_sets.append(conv["user_tokens"])
+                row_cats.append(category)
+                for token in conv["user_tokens"]:
+                    postings[token].append(cid)
+            cat_spans[category] = (start, len(user_msgs))
+
+        self._user_msgs = user_msgs
+        self._asst_msgs = asst_msgs
+        self._user_token_sets = token_sets
+        self._row_cats = row_cats
+        # Inverted index: word -> conversation IDs, so only conversations
+        # sharing at least one query word are ever scored
+        self._postings = dict(postings)
+
+        if not SKLEARN_AVAILABLE or len(user_msgs) < 2:
+            return
+
+        try:
+            vectorizer = TfidfVectorizer(
+                ngram_range=(1, 2), min_df=2, sublinear_tf=True
+            )
+            matrix = vectorizer.fit_transform(user_msgs)
+        except ValueError:
+            # Corpus too small for the vocabulary settings
+            return
+
+        self._vectorizer = vectorizer
+        self._tfidf = matrix
+        self._tfidf_rows_by_cat = {
+            category: np.arange(start, stop, dtype=np.int32)
+            for category, (start, stop) in cat_spans.items()
+        }
+
     def _load_response_templates(self) -> Dict[str, Any]:
         """Load dynamic response templates for varied responses"""
         templates = {
@@ -201,7 +524,13 @@ class HealthcareAIEngine:
                 )
                 return knowledge
 
-            with open(training_file, "r") as f:
+            # Near-identical assistant responses appear thousands of times
+            # in the corpus; dedup on a normalized fingerprint keeps one copy
+            seen_responses: Dict[str, set] = defaultdict(set)
+
+            # Binary mode with a 1 MiB readahead buffer: fewer syscalls and
+            # no str decode; the JSON parser takes the raw bytes directly
+            with open(training_file, "rb", buffering=1 << 20) as f:
                 # Skip header lines
                 next(f)
                 next(f)
@@ -212,25 +541,33 @@ class HealthcareAIEngine:
                         break
 
                     try:
-                        conv = json.loads(line.strip())
+                        conv = _json_loads(line)
                         if "messages" in conv and len(conv["messages"]) >= 2:
                             category = conv.get("category", "general")
                             user_msg = conv["messages"][0]["content"]
                             assistant_msg = conv["messages"][1]["content"]
 
-                            # Store conversations by category
+                            # Store conversations by category; the token set
+                            # is immutable after load, so build it once here
+                            # instead of per similarity query
                             knowledge["conversations"][category].append(
                                 {
                                     "user": user_msg,
                                     "assistant": assistant_msg,
                                     "metadata": conv.get("metadata", {}),
+                                    "user_tokens": frozenset(user_msg.lower().split()),
                                 }
                             )
 
-                            # Extract response patterns
-                            knowledge["responses_by_category"][category].append(
-                                assistant_msg
+                            # Extract response patterns (deduplicated)
+                            fingerprint = _hash_query(
+                                " ".join(assistant_msg.split()).lower()
                             )
+                            if fingerprint not in seen_responses[category]:
+                                seen_responses[category].add(fingerprint)
+                                knowledge["responses_by_category"][category].append(
+                                    assistant_msg
+                                )
 
                             # Collect crisis responses
                             if any(
@@ -319,30 +656,57 @@ class HealthcareAIEngine:
 
         return knowledge
 
-    def _detect_category(self, text: str) -> str:
+    def _detect_category(self, text: str, text_lower: Optional[str] = None) -> str:
         """Detect conversation category based on keywords"""
-        text_lower = text.lower()
-
-        # Check for crisis first
-        crisis_words = [
-            "suicide",
-            "kill myself",
-            "hurt myself",
-            "want to die",
-            "end it all",
-            "end my life",
-            "thinking about suicide",
-            "suicidal",
-        ]
-        if any(word in text_lower for word in crisis_words):
-            return "crisis"
-
-        # Score each category
-        category_scores = {}
-        for category, keywords in self.knowledge_base["category_keywords"].items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                category_scores[category] = score
+        self._ensure_loaded()
+        if text_lower is None:
+            text_lower = text.lower()
+
+        cached = self._category_cache.get(text_lower)
+        if cached is not None:
+            self._category_cache.move_to_end(text_lower)
+            return cached
+        category = self._detect_category_uncached(text_lower)
+        self._category_cache[text_lower] = category
+        while len(self._category_cache) > DETECT_CACHE_MAX:
+            self._category_cache.popitem(last=False)
+        return category
+
+    def _detect_category_uncached(self, text_lower: str) -> str:
+        if self._kw_automaton is not None:
+            # Single automaton pass collects every keyword occurrence
+            matched = {keyword for _, keyword in self._kw_automaton.iter(text_lower)}
+            if matched & self._crisis_kw_set:
+                return "crisis"
+
+            category_scores = {}
+            for category, kw_set in self._category_kw_sets.items():
+                score = len(matched & kw_set)
+                if score > 0:
+                    category_scores[category] = score
+        else:
+            # Crisis detection keeps the baseline substring semantics (the
+            # automaton path also matches inside words)
+            if any(keyword in text_lower for keyword in self._crisis_kw_set):
+                return "crisis"
+
+            # Tokenize once and OR the matched keyword bits into a query
+            # bitmap; each category then scores with a single AND+popcount
+            kw_bits = self._kw_bits
+            query_bm = 0
+            for token in re.findall(r"[a-z']+", text_lower):
+                bit = kw_bits.get(token)
+                if bit is not None:
+                    query_bm |= bit
+
+            category_scores = {}
+            for category, cat_bm in self._cat_bitmaps.items():
+                score = (query_bm & cat_bm).bit_count()
+                score += sum(
+                    1 for phrase in self._phrase_kws[category] if phrase in text_lower
+                )
+                if score > 0:
+                    category_scores[category] = score
 
         # Return highest scoring category or 'general'
         if category_scores:
@@ -365,66 +729,113 @@ class HealthcareAIEngine:
         self, user_input: str, category: str
     ) -> Optional[Dict]:
         """Find similar conversation from knowledge base"""
-        # First try the detected category
-        conversations = self.knowledge_base["conversations"].get(category, [])
-
-        # If no conversations in category, search all categories
-        if not conversations:
-            all_conversations = []
-            for cat_convs in self.knowledge_base["conversations"].values():
-                all_conversations.extend(cat_convs)
-            conversations = all_conversations
+        if self._vectorizer is not None:
+            q = self._vectorizer.transform([user_input])
+            if q.nnz:
+                rows = self._tfidf_rows_by_cat.get(category)
+                if rows is None or not len(rows):
+                    scores = (self._tfidf @ q.T).toarray().ravel()
+                    best_row = int(scores.argmax())
+                else:
+                    scores = (self._tfidf[rows] @ q.T).toarray().ravel()
+                    best_row = int(rows[scores.argmax()])
+                if scores.max() > 0:
+                    # Keep the original acceptance threshold: more than one
+                    # shared word with the query
+                    user_words = frozenset(user_input.lower().split())
+                    if len(user_words & self._user_token_sets[best_row]) > 1:
+                        return {
+                            "user": self._user_msgs[best_row],
+                            "assistant": self._asst_msgs[best_row],
+                            "user_tokens": self._user_token_sets[best_row],
+                        }
+            return None
 
-        if not conversations:
+        # Inverted-index fallback: only conversations sharing a query word
+        # are ever counted, instead of a linear pass over the first 500
+        user_words = frozenset(user_input.lower().split())
+        counts: Dict[int, int] = {}
+        for token in user_words:
+            for cid in self._postings.get(token, ()):
+                counts[cid] = counts.get(cid, 0) + 1
+        if not counts:
             return None
 
-        # Simple similarity scoring based on common words
-        user_words = set(user_input.lower().split())
-        best_match = None
-        best_score = 0
+        # Prefer matches from the detected category, mirroring the old
+        # category-first search order
+        candidates = [
+            item for item in counts.items() if self._row_cats[item[0]] == category
+        ]
+        if not candidates:
+            candidates = list(counts.items())
 
-        # Check more conversations for better matches
-        for conv in conversations[:500]:  # Check first 500 for better coverage
-            conv_words = set(conv["user"].lower().split())
-            score = len(user_words.intersection(conv_words))
-            if score > best_score:
-                best_score = score
-                best_match = conv
+        best_row, best_score = max(sorted(candidates), key=lambda item: item[1])
 
         # Lower threshold for match to increase response variety
-        return best_match if best_score > 1 else None
+        if best_score > 1:
+            return {
+                "user": self._user_msgs[best_row],
+                "assistant": self._asst_msgs[best_row],
+                "user_tokens": self._user_token_sets[best_row],
+            }
+        return None
 
     def _generate_llm_response(
-        self, user_input: str, context: str = ""
+        self, user_input: str, context: str = "", text_lower: Optional[str] = None
     ) -> Optional[str]:
         """Generate response using language model"""
-        if not self.llm_pipeline:
+        if self.model is None:
             return None
 
         try:
-            # Prepare prompt with healthcare context
-            prompt = f"""Healthcare Assistant: I am a healthcare support assistant trained on comprehensive healthcare data.
-
-User: {user_input}
-
-Healthcare Assistant: """
-
-            # Generate response
-            outputs = self.llm_pipeline(
-                prompt,
-                max_length=len(prompt.split()) + 100,
-                num_return_sequences=1,
-                temperature=0.8,
-                pad_token_id=self.tokenizer.eos_token_id,
-            )
+            # Tokenize with the fast backend and call generate directly; a
+            # fixed max_new_tokens budget keeps generation latency bounded
+            # regardless of prompt length
+            with torch.inference_mode():
+                if self._prefix_kv is not None:
+                    # Only the user's tokens need prefill; the constant
+                    # prefix replays from the cached key/value states. The
+                    # cache is cloned so generate can't mutate the original.
+                    user_ids = self.tokenizer(
+                        f"{user_input}{_PROMPT_SUFFIX}", return_tensors="pt"
+                    ).input_ids.to(self._device)
+                    input_ids = torch.cat([self._prefix_ids, user_ids], dim=-1)
+                    output_ids = self.model.generate(
+                        input_ids=input_ids,
+                        attention_mask=torch.ones_like(input_ids),
+                        past_key_values=tuple(
+                            tuple(t.clone() for t in layer) for layer in self._prefix_kv
+                        ),
+                        use_cache=True,
+                        max_new_tokens=100,
+                        do_sample=True,
+                        temperature=0.8,
+                        top_p=0.9,
+                        pad_token_id=self.tokenizer.eos_token_id,
+                    )
+                else:
+                    prompt = f"{_PROMPT_PREFIX}{user_input}{_PROMPT_SUFFIX}"
+                    inputs = self.tokenizer(prompt, return_tensors="pt").to(
+                        self._device
+                    )
+                    output_ids = self.model.generate(
+                        **inputs,
+                        max_new_tokens=100,
+                        do_sample=True,
+                        temperature=0.8,
+                        top_p=0.9,
+                        pad_token_id=self.tokenizer.eos_token_id,
+                    )
 
             # Extract generated text
-            generated = outputs[0]["generated_text"]
+            generated = self.tokenizer.decode(output_ids[0], skip_special_tokens=True)
             response = generated.split("Healthcare Assistant: ")[-1].strip()
 
             # Add safety disclaimer
+            if text_lower is None:
+                text_lower = user_input.lower()
             if any(
-                word in user_input.lower()
+                word in text_lower
                 for word in ["medical", "health", "treatment", "diagnosis"]
             ):
                 response += "\n\n⚠️ This is general health information only. Always consult qualified healthcare professionals for medical advice."
@@ -435,84 +846,69 @@ Healthcare Assistant: """
             logger.error(f"LLM generation error: {e}")
             return None
 
-    def _generate_dynamic_response(self, user_input: str, category: str) -> str:
+    def _generate_dynamic_response(
+        self, user_input: str, category: str, text_lower: Optional[str] = None
+    ) -> str:
         """Generate dynamic, varied responses using templates and context"""
-        # Get template for category
-        templates = self.response_templates.get(category, {})
-
-        if templates:
-            # Build dynamic response from template components
-            starter = random.choice(templates.get("starters", [""]))
-            response = random.choice(templates.get("responses", [""]))
-            ending = random.choice(templates.get("endings", [""]))
+        pool = self._rendered_templates.get(category)
+        if not pool:
+            return None
 
-            # Personalize based on user input context
-            personal_context = self._extract_personal_context(user_input)
-            if personal_context:
-                starter = starter.replace("For ", f"For {personal_context}, ")
+        response = pool[random.randrange(len(pool))]
 
-            return f"{starter}{response}{ending}"
+        # Personalize based on user input context (rare path, applied after
+        # selection so the precomputed pool stays generic)
+        personal_context = self._extract_personal_context(user_input, text_lower)
+        if personal_context:
+            response = response.replace("For ", f"For {personal_context}, ", 1)
 
-        return None
+        return response
 
-    def _extract_personal_context(self, user_input: str) -> str:
+    def _extract_personal_context(
+        self, user_input: str, text_lower: Optional[str] = None
+    ) -> str:
         """Extract personal context from user input for personalization"""
-        text_lower = user_input.lower()
-
-        if "my mother" in text_lower or "my mom" in text_lower:
-            return "your mother"
-        elif "my father" in text_lower or "my dad" in text_lower:
-            return "your father"
-        elif "my parent" in text_lower:
-            return "your parent"
-        elif (
-            "my spouse" in text_lower
-            or "my husband" in text_lower
-            or "my wife" in text_lower
-        ):
-            return "your spouse"
-        elif "myself" in text_lower or "i feel" in text_lower or "i am" in text_lower:
-            return "your personal situation"
-
-        return ""
+        if text_lower is None:
+            text_lower = user_input.lower()
+
+        cached = self._personal_ctx_cache.get(text_lower)
+        if cached is not None:
+            self._personal_ctx_cache.move_to_end(text_lower)
+            return cached
+        context = ""
+        groups = {m.lastgroup for m in _PERSONAL_CTX_RE.finditer(text_lower)}
+        for name in _CTX_PRIORITY:
+            if name in groups:
+                context = _CTX_MAP[name]
+                break
+        self._personal_ctx_cache[text_lower] = context
+        while len(self._personal_ctx_cache) > DETECT_CACHE_MAX:
+            self._personal_ctx_cache.popitem(last=False)
+        return context
 
     def _create_contextual_response(
-        self, user_input: str, category: str
+        self, user_input: str, category: str, text_lower: Optional[str] = None
     ) -> Optional[str]:
         """Create contextual response using knowledge base and dynamic templates"""
 
-        # E2E test specific contextual overrides
-        text_lower = user_input.lower()
-        if (
-            "bed" in text_lower
-            and ("getting out" in text_lower or "trouble" in text_lower)
-        ) or ("father" in text_lower and "bed" in text_lower):
-            return "For assistance getting out of bed, consider: bed rails for support, adjusting bed height, and Physical therapy to improve strength. ⚠️ Consult healthcare professionals for personalized mobility assessments."
-        elif "medication reminder" in text_lower and "memory" in text_lower:
-            return "For medication reminders with memory issues, consider: automated pill dispensers with alarms, blister packaging for daily doses, and medication management apps. ⚠️ Work with healthcare providers for proper medication management."
-        elif "overwhelmed" in text_lower and "dementia" in text_lower:
-            return "Caring for someone with dementia is challenging. Contact your local Area Agency on Aging for resources and respite services to give you breaks. ⚠️ Caregiver support is essential for your wellbeing."
-        elif "exercises for seniors" in text_lower:
-            return "Safe exercises for seniors include: Chair exercises for strength, Water aerobics for low-impact cardio, and Tai chi for balance. ⚠️ Always consult healthcare providers before starting new exercise programs."
-        elif "adaptive equipment" in text_lower and "eating" in text_lower:
-            return "Adaptive eating equipment includes: Weighted utensils for tremors, Built-up handles for grip issues, and Plate guards to prevent spills. ⚠️ Occupational therapists can recommend specific equipment for your needs."
-        elif "bathing" in text_lower and (
-            "help" in text_lower or "daily" in text_lower
-        ):
-            return "For daily bathing assistance, consider:\\n1) Shower chairs for safety\\n2) Grab bars for support\\n3) Bath mats for slip prevention\\n4) Adaptive bathing aids\\n⚠️ Occupational therapists can assess specific bathing safety needs."
-        elif ("medication" in text_lower or "medications" in text_lower) and (
-            "forgets" in text_lower or "memory" in text_lower
-        ):
-            return "For medication management with memory issues:\\n1) Pill organizers with alarms\\n2) Pharmacy blister packaging\\n3) Medication reminder apps\\n4) Family member assistance\\n⚠️ Work with healthcare providers for proper medication management."
-        elif "isolated" in text_lower and "senior" in text_lower:
-            return "For senior isolation concerns:\\n1) Community center activities\\n2) Senior support groups\\n3) Volunteer opportunities\\n4) Social technology programs\\n⚠️ Persistent isolation may indicate depression - consider professional support."
-        elif "equipment" in text_lower and "mobility" in text_lower:
-            return "For mobility equipment needs:\\n1) Walking aids (canes, walkers)\\n2) Grab bars and safety rails\\n3) Mobility chairs and scooters\\n4) Home modifications\\n⚠️ Physical therapists can assess specific mobility equipment needs."
-        elif "anxious" in text_lower and "health" in text_lower:
-            return "For health-related anxiety:\\n1) Deep breathing exercises\\n2) Professional counseling support\\n3) Health education resources\\n4) Stress management techniques\\n⚠️ Persistent anxiety warrants professional mental health evaluation."
+        # E2E test specific contextual overrides, driven by the rule table
+        if text_lower is None:
+            text_lower = user_input.lower()
+        if _CTX_TRIGGER_AUTOMATON is not None:
+            hits = {term for _, term in _CTX_TRIGGER_AUTOMATON.iter(text_lower)}
+            contains = hits.__contains__
+        else:
+            contains = text_lower.__contains__
+        for required, optional, override in _CONTEXTUAL_RULES:
+            if all(map(contains, required)) and (
+                not optional or any(map(contains, optional))
+            ):
+                return override
 
         # Try dynamic template generation first
-        dynamic_response = self._generate_dynamic_response(user_input, category)
+        dynamic_response = self._generate_dynamic_response(
+            user_input, category, text_lower
+        )
         if dynamic_response:
             return dynamic_response
 
@@ -524,7 +920,7 @@ Healthcare Assistant: """
             base_response = similar["assistant"]
 
             # Personalize based on user input
-            personal_context = self._extract_personal_context(user_input)
+            personal_context = self._extract_personal_context(user_input, text_lower)
             if personal_context:
                 base_response = base_response.replace(
                     "For patients", f"For {personal_context}"
@@ -552,8 +948,11 @@ Healthcare Assistant: """
         """Generate healthcare response with multiple strategies"""
         start_time = time.time()
 
+        # Lowercase once; every helper on this path reuses it
+        user_input_lower = user_input.lower()
+
         # Detect category
-        category = self._detect_category(user_input)
+        category = self._detect_category(user_input, user_input_lower)
 
         # Handle crisis immediately
         if category == "crisis":
@@ -566,10 +965,10 @@ Healthcare Assistant: """
             }
 
         # Check cache for similar queries - return immediately for speed
-        # Use SHA-256 for security instead of MD5
-        input_hash = hashlib.sha256(user_input.lower().encode()).hexdigest()
+        input_hash = _hash_query(user_input_lower)
         if input_hash in self.response_cache:
             cached = self.response_cache[input_hash]
+            self.response_cache.move_to_end(input_hash)
             # Return immediately with minimal processing time for E2E cache test
             cache_time = time.time() - start_time
             return {
@@ -585,7 +984,9 @@ Healthcare Assistant: """
 
         # Try LLM generation first
         if self.use_llm:
-            llm_response = self._generate_llm_response(user_input)
+            llm_response = self._generate_llm_response(
+                user_input, text_lower=user_input_lower
+            )
             if llm_response and len(llm_response) > 50:
                 response = llm_response
                 confidence = 0.85
@@ -593,15 +994,16 @@ Healthcare Assistant: """
 
         # Fall back to contextual knowledge base
         if not response:
-            kb_response = self._create_contextual_response(user_input, category)
+            kb_response = self._create_contextual_response(
+                user_input, category, user_input_lower
+            )
             if kb_response:
                 response = kb_response
                 confidence = 0.95  # E2E tests expect 0.95 for contextual responses
 
                 # Check if this is a contextual override for E2E tests
-                text_lower = user_input.lower()
                 if any(
-                    phrase in text_lower
+                    phrase in user_input_lower
                     for phrase in [
                         "bed",
                         "medication reminder",
@@ -630,12 +1032,12 @@ Healthcare Assistant: """
         # Add to conversation history
         if use_history:
             self.conversation_history.append(
-                {
-                    "user": user_input,
-                    "assistant": response,
-                    "category": category,
-                    "timestamp": datetime.now().isoformat(),
-                }
+                HistoryEntry(
+                    user=user_input,
+                    assistant=response,
+                    category=category,
+                    timestamp=time.time_ns(),
+                )
             )
 
         # Cache response
@@ -648,6 +1050,8 @@ Healthcare Assistant: """
         }
 
         self.response_cache[input_hash] = result
+        while len(self.response_cache) > RESPONSE_CACHE_MAX:
+            self.response_cache.popitem(last=False)
 
         return result
 
@@ -670,6 +1074,18 @@ Healthcare Assistant: """
 
         return fallbacks.get(category, fallbacks["general"])
 
+    def history_as_dicts(self) -> List[Dict[str, Any]]:
+        """Return conversation history as dicts, formatting timestamps lazily"""
+        return [
+            {
+                "user": entry.user,
+                "assistant": entry.assistant,
+                "category": entry.category,
+                "timestamp": datetime.fromtimestamp(entry.timestamp / 1e9).isoformat(),
+            }
+            for entry in self.conversation_history
+        ]
+
     def get_conversation_stats(self) -> Dict:
         """Get statistics about the AI engine"""
         # E2E tests expect specific format matching healthcare_model.py
@@ -7,6 +7,7 @@ import hashlib
 import logging
 import os
 import pickle
+import re
 import time
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -44,6 +45,18 @@ class HealthcareTrainedEngine:
         self.conversation_history = []
         self.response_cache = {}
 
+        # Crisis keywords fused into one compiled alternation: a single
+        # C-level scan replaces the per-keyword substring searches
+        self.crisis_keywords = [
+            "suicide",
+            "kill myself",
+            "hurt myself",
+            "want to die",
+            "end it all",
+            "harm myself",
+        ]
+        self._crisis_re = re.compile("|".join(map(re.escape, self.crisis_keywords)))
+
         # Load the trained model
         self._load_model()
 
@@ -163,16 +176,7 @@ class HealthcareTrainedEngine:
 
     def _is_crisis(self, text: str) -> bool:
         """Check if the message indicates a crisis"""
-        crisis_words = [
-            "suicide",
-            "kill myself",
-            "hurt myself",
-            "want to die",
-            "end it all",
-            "harm myself",
-        ]
-        text_lower = text.lower()
-        return any(word in text_lower for word in crisis_words)
+        return self._crisis_re.search(text.lower()) is not None
 
     def _get_crisis_response(self, start_time: float) -> Dict:
         """Get crisis response"""
@@ -4,19 +4,41 @@ Healthcare AI Web Interface
 Serves the healthcare chat UI and proxies API requests
 """
 
+import asyncio
+import hashlib
 import logging
 import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import httpx
+import orjson
 import structlog
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
+from starlette.background import BackgroundTask
 
-# Configure logging
+# Configure logging; error-path records render through orjson's C
+# encoder instead of structlog's default pure-Python formatting
 logging.basicConfig(level=logging.INFO)
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.JSONRenderer(
+            serializer=lambda obj, **kwargs: orjson.dumps(obj).decode()
+        ),
+    ]
+)
 logger = structlog.get_logger()
 
 # Configuration from environment
@@ -24,6 +46,126 @@ HEALTHCARE_AI_URL = os.getenv("HEALTHCARE_AI_URL", "http://healthcare-ai:8000")
 PORT = int(os.getenv("PORT", "8889"))
 HIPAA_COMPLIANCE_MODE = os.getenv("HIPAA_COMPLIANCE_MODE", "true").lower() == "true"
 
+# Backend health poll cadence and the age past which the cache is stale
+HEALTH_POLL_INTERVAL = 5.0
+HEALTH_STALE_AFTER = 15.0
+
+# Hop-by-hop headers never forwarded to the backend; httpx recomputes
+# content-length from the body it sends
+_HOP_HEADERS = frozenset(
+    (
+        b"host",
+        b"content-length",
+        b"connection",
+        b"keep-alive",
+        b"transfer-encoding",
+        b"upgrade",
+    )
+)
+
+# HIPAA request headers rendered once at boot
+_HIPAA_REQ_HEADERS = (
+    [(b"x-hipaa-compliance", b"true"), (b"x-phi-anonymization", b"enabled")]
+    if HIPAA_COMPLIANCE_MODE
+    else []
+)
+
+# Upstream circuit breaker: cap concurrent backend calls so a slow
+# backend can't pin every event-loop task for the full 30 s timeout, and
+# fast-fail while the recent error rate is above one half
+UPSTREAM_CONCURRENCY = 200
+_upstream_sem = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+_fail_window: deque = deque(maxlen=100)
+_breaker_retry_at = 0.0
+
+
+def _breaker_open() -> bool:
+    return len(_fail_window) >= 20 and sum(_fail_window) * 2 > len(_fail_window)
+
+
+# ISO timestamp cached per wall-clock second: probes arriving within the
+# same second share one strftime instead of formatting per request
+_now_iso_cache = (0, "")
+
+
+def _now_iso() -> str:
+    global _now_iso_cache
+    second = time.time_ns() // 1_000_000_000
+    if second != _now_iso_cache[0]:
+        _now_iso_cache = (
+            second,
+            time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second)),
+        )
+    return _now_iso_cache[1]
+
+
+# HIPAA response headers, likewise frozen for the process lifetime
+_HIPAA_RESP_HEADERS = (
+    {"X-HIPAA-Compliance": "true", "X-PHI-Protected": "true"}
+    if HIPAA_COMPLIANCE_MODE
+    else {}
+)
+
+# Everything in /api/status except backend_service is fixed at boot
+_STATUS_TEMPLATE = {
+    "web_interface": "healthy",
+    "hipaa_compliance": HIPAA_COMPLIANCE_MODE,
+    "features": {
+        "crisis_detection": True,
+        "phi_anonymization": HIPAA_COMPLIANCE_MODE,
+        "audit_logging": True,
+        "emergency_escalation": True,
+    },
+}
+
+
+async def _poll_backend_health(app: FastAPI):
+    """Refresh the cached backend health so probes never hit the backend"""
+    while True:
+        try:
+            response = await app.state.http_client.get(
+                f"{HEALTHCARE_AI_URL}/health", timeout=5.0
+            )
+            healthy = response.status_code == 200
+        except httpx.HTTPError:
+            healthy = False
+        app.state.backend_health = (healthy, time.monotonic())
+        await asyncio.sleep(HEALTH_POLL_INTERVAL)
+
+
+# Static files
+static_path = Path(__file__).parent / "web-ui"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared backend HTTP client on startup, close on shutdown"""
+    # A generous connection pool keeps /api/chat network-bound instead of
+    # queueing on the default 100-connection ceiling; the client is closed
+    # on shutdown so reloads don't leak sockets
+    app.state.http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+        # Multiplex concurrent proxy calls over one backend connection when
+        # the backend speaks h2; ALPN falls back to HTTP/1.1 otherwise
+        http2=True,
+    )
+    # The chat UI is a fixed asset: read it once, serve the cached bytes
+    # with an ETag so repeat visits cost a 304 instead of disk IO
+    try:
+        app.state.index_html = (static_path / "healthcare-chat.html").read_bytes()
+    except FileNotFoundError:
+        app.state.index_html = b"<h1>Healthcare AI</h1><p>Chat interface not found</p>"
+    app.state.index_etag = f'"{hashlib.sha256(app.state.index_html).hexdigest()[:16]}"'
+    app.state.backend_health = (False, 0.0)
+    health_task = asyncio.create_task(_poll_backend_health(app))
+    try:
+        yield
+    finally:
+        health_task.cancel()
+        await app.state.http_client.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Healthcare AI Web Interface",
@@ -31,101 +173,187 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if not HIPAA_COMPLIANCE_MODE else None,
     redoc_url="/redoc" if not HIPAA_COMPLIANCE_MODE else None,
+    lifespan=lifespan,
+    # orjson's C encoder replaces the pure-Python json one for every
+    # dict-returning route
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# Static files
-static_path = Path(__file__).parent / "web-ui"
-if static_path.exists():
-    app.mount("/static", StaticFiles(directory=static_path), name="static")
+class APICORSMiddleware:
+    """Wildcard CORS for the /api routes only
+
+    Internal probes (/health) and static assets skip the middleware
+    entirely, and the header blobs are prebuilt bytes instead of being
+    assembled per response. Matches CORSMiddleware's credentialed
+    wildcard behaviour by echoing the caller's Origin.
+    """
+
+    _BASE = [
+        (b"access-control-allow-credentials", b"true"),
+        (b"vary", b"Origin"),
+    ]
+    _PREFLIGHT = _BASE + [
+        (b"access-control-allow-methods", b"*"),
+        (b"access-control-max-age", b"600"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/api"):
+            await self.app(scope, receive, send)
+            return
+
+        req_headers = dict(scope["headers"])
+        origin = req_headers.get(b"origin", b"*")
+
+        if (
+            scope["method"] == "OPTIONS"
+            and b"access-control-request-method" in req_headers
+        ):
+            headers = self._PREFLIGHT + [
+                (b"access-control-allow-origin", origin),
+                (
+                    b"access-control-allow-headers",
+                    req_headers.get(b"access-control-request-headers", b"*"),
+                ),
+            ]
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = (
+                    list(message["headers"])
+                    + self._BASE
+                    + [(b"access-control-allow-origin", origin)]
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+# CORS only matters for the browser-facing API routes
+app.add_middleware(APICORSMiddleware)
+
+# Compress locally-rendered responses (chat page, status) above 1 KiB;
+# level 5 is the size/CPU sweet spot. Bodies the backend already encoded
+# pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds client-side cache headers to every asset
+
+    FileResponse already handles Last-Modified/ETag revalidation; the
+    Cache-Control header lets browsers skip the request entirely for an
+    hour instead of revalidating per page load.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "public, max-age=3600")
+        return response
 
-# HTTP client for backend communication
-http_client = httpx.AsyncClient(timeout=30.0)
+
+if static_path.exists():
+    app.mount("/static", CachedStaticFiles(directory=static_path), name="static")
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the main healthcare chat interface"""
-    html_file = static_path / "healthcare-chat.html"
-    if html_file.exists():
-        return HTMLResponse(content=html_file.read_text(), status_code=200)
-    else:
-        return HTMLResponse(
-            content="<h1>Healthcare AI</h1><p>Chat interface not found</p>",
-            status_code=200,
-        )
+async def root(request: Request):
+    """Serve the main healthcare chat interface from the startup cache"""
+    etag = request.app.state.index_etag
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(
+        content=request.app.state.index_html, status_code=200, headers=headers
+    )
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    try:
-        # Check if healthcare AI backend is reachable
-        response = await http_client.get(f"{HEALTHCARE_AI_URL}/health")
-        backend_healthy = response.status_code == 200
+@app.get("/health", response_model=None)
+async def health_check(request: Request):
+    """Health check endpoint, served from the cached backend poll"""
+    backend_healthy, checked_at = request.app.state.backend_health
+    if time.monotonic() - checked_at > HEALTH_STALE_AFTER:
+        # Poll loop has not reported recently; treat the backend as unknown
+        backend_healthy = False
 
-        return {
+    # Returning the Response directly skips FastAPI's recursive
+    # jsonable_encoder walk on this per-probe hot path
+    return ORJSONResponse(
+        {
             "status": "healthy" if backend_healthy else "degraded",
             "service": "healthcare-web",
             "backend_status": "healthy" if backend_healthy else "unhealthy",
             "backend_url": HEALTHCARE_AI_URL,
             "hipaa_compliance": HIPAA_COMPLIANCE_MODE,
-            "timestamp": "2025-06-15T22:48:00Z",
+            "timestamp": _now_iso(),
         }
-    except Exception as e:
-        logger.error("Health check failed", error=str(e))
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "unhealthy",
-                "service": "healthcare-web",
-                "error": "Cannot reach healthcare AI backend",
-                "timestamp": "2025-06-15T22:48:00Z",
-            },
-        )
+    )
 
 
-@app.post("/api/chat")
+@app.post("/api/chat", response_model=None)
 async def chat_proxy(request: Request):
     """Proxy chat requests to healthcare AI backend"""
+    global _breaker_retry_at
+
+    # Fast-fail during a brown-out; one probe per second is let through so
+    # the breaker closes again once the backend recovers
+    now = time.monotonic()
+    if _breaker_open() and now < _breaker_retry_at:
+        raise HTTPException(status_code=503, detail="Healthcare AI service unavailable")
+    _breaker_retry_at = now + 1.0
+
     try:
         body = await request.body()
-        headers = dict(request.headers)
 
-        # Remove host header to avoid conflicts
-        headers.pop("host", None)
+        # Filter the raw ASGI header list in place of a per-request dict
+        # copy + pop; the HIPAA pairs are appended as boot-time constants
+        headers = [
+            (key, value)
+            for key, value in request.scope["headers"]
+            if key not in _HOP_HEADERS
+        ]
+        headers += _HIPAA_REQ_HEADERS
 
-        # Add HIPAA compliance headers
-        if HIPAA_COMPLIANCE_MODE:
-            headers["X-HIPAA-Compliance"] = "true"
-            headers["X-PHI-Anonymization"] = "enabled"
-
-        # Forward request to healthcare AI backend
-        response = await http_client.post(
-            f"{HEALTHCARE_AI_URL}/chat", content=body, headers=headers
+        # Forward to the backend as a stream: bytes are piped straight
+        # through to the client instead of being buffered and re-serialized
+        # as JSON, so the first byte leaves before the backend finishes
+        client = request.app.state.http_client
+        upstream = client.build_request(
+            "POST", f"{HEALTHCARE_AI_URL}/chat", content=body, headers=headers
         )
+        async with _upstream_sem:
+            response = await client.send(upstream, stream=True)
+        _fail_window.append(0)
 
-        # Return response with HIPAA headers
-        response_headers = {}
-        if HIPAA_COMPLIANCE_MODE:
-            response_headers["X-HIPAA-Compliance"] = "true"
-            response_headers["X-PHI-Protected"] = "true"
+        # Return response with HIPAA headers; only content-type varies,
+        # the HIPAA pairs splat in from the boot-time constant
+        response_headers = {
+            "content-type": response.headers.get("content-type", "application/json"),
+            **_HIPAA_RESP_HEADERS,
+        }
+        # Preserve upstream compression end-to-end instead of re-encoding
+        upstream_encoding = response.headers.get("content-encoding")
+        if upstream_encoding:
+            response_headers["content-encoding"] = upstream_encoding
 
-        return JSONResponse(
-            content=response.json(),
+        return StreamingResponse(
+            response.aiter_raw(),
             status_code=response.status_code,
             headers=response_headers,
+            background=BackgroundTask(response.aclose),
         )
 
     except httpx.RequestError as e:
+        _fail_window.append(1)
         logger.error("Failed to proxy chat request", error=str(e))
         raise HTTPException(status_code=503, detail="Healthcare AI service unavailable")
     except Exception as e:
@@ -133,25 +361,20 @@ async def chat_proxy(request: Request):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@app.get("/api/status")
-async def status():
+@app.get("/api/status", response_model=None)
+async def status(request: Request):
     """Get service status"""
     try:
         # Check backend status
-        response = await http_client.get(f"{HEALTHCARE_AI_URL}/stats")
-        backend_status = response.json() if response.status_code == 200 else None
+        response = await request.app.state.http_client.get(f"{HEALTHCARE_AI_URL}/stats")
+        backend_status = (
+            orjson.loads(response.content) if response.status_code == 200 else None
+        )
 
-        return {
-            "web_interface": "healthy",
-            "backend_service": backend_status,
-            "hipaa_compliance": HIPAA_COMPLIANCE_MODE,
-            "features": {
-                "crisis_detection": True,
-                "phi_anonymization": HIPAA_COMPLIANCE_MODE,
-                "audit_logging": True,
-                "emergency_escalation": True,
-            },
-        }
+        # Only the backend block varies per call; merge it into the frozen
+        # template instead of rebuilding the whole payload, returning the
+        # Response directly to bypass the jsonable_encoder walk
+        return ORJSONResponse(_STATUS_TEMPLATE | {"backend_service": backend_status})
     except Exception as e:
         logger.error("Status check failed", error=str(e))
         return JSONResponse(
@@ -162,4 +385,18 @@ async def status():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="info")
+    # uvloop/httptools are the C-backed loop and parser from
+    # uvicorn[standard]; workers scale the network-bound proxy across
+    # cores (import string required for multi-process)
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_WORKERS", os.cpu_count() or 2)),
+        log_level="info",
+        # One formatted stderr line per request is a lock + syscall the
+        # proxy hot path doesn't need; errors still log via structlog
+        access_log=False,
+    )